@@ -3,7 +3,7 @@ import logging
 
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from db.base import init_db
 from models.secret_key import SecretKeyIndex
@@ -11,6 +11,7 @@ from models.alerts import BaseAlert
 from routes import alert_router
 from routes.data.router import data_router
 from routes.keys.router import keys_router
+from routes.keys.service import load_key_filter
 from decouple import config
 
 # Configure logging
@@ -25,6 +26,8 @@ DB_URL = config('MONGO_DB_CONNECTION_STRING')
 DB_NAME = config('MONGO_DB_NAME')
 ENVIRONMENT = config('ENVIRONMENT', default='development')
 ALLOWED_ORIGINS = config('ALLOWED_ORIGINS', default='http://localhost:3000').split(',')
+# Only safe for single-process deployments; see SecretKeyFilter
+KEY_FILTER_ENABLED = config('KEY_FILTER_ENABLED', default=False, cast=bool)
 
 
 @asynccontextmanager
@@ -41,6 +44,8 @@ async def lifespan(app: FastAPI):
             models=[BaseAlert, SecretKeyIndex]
         )
         logger.info("Database initialized successfully")
+        if KEY_FILTER_ENABLED:
+            await load_key_filter()
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
@@ -58,7 +63,8 @@ app = FastAPI(
     title="Arrow Backend API",
     description="Trading alert management system with strategy key authentication",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
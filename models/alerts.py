@@ -54,5 +54,8 @@ class BaseAlert(Document):
             IndexModel(
                 keys=uniqueIndex,
                 unique=True,
-            )
+            ),
+            IndexModel(
+                keys=[(k.NAME.lower(), 1)],
+            ),
         ]
@@ -11,11 +11,11 @@ class SecretKeyIndex(Document):
 
     Fields:
         secret_key: Unique cryptographic key for authentication
-        name: Strategy name associated with this key
+        name: Unique strategy name associated with this key
         description: Optional description of the key's purpose
     """
     secret_key: Indexed(str, unique=True)  # Unique index for fast lookups
-    name: Indexed(str)  # Index for searching by strategy name
+    name: Indexed(str, unique=True)  # One key per strategy; makes upsert_key race-free
     description: Optional[str] = None
 
     class Settings:
@@ -121,6 +121,18 @@ class DataRepository:
             return True
         return False
 
+    async def get_strategy_names(self) -> List[str]:
+        """
+        Retrieve the unique strategy names across all alerts.
+
+        Runs a server-side distinct on the indexed name field, so no alert
+        documents are transferred or hydrated.
+
+        Returns:
+            List of unique, non-null strategy names
+        """
+        return await BaseAlert.distinct("name", {"name": {"$ne": None}})
+
     async def query(self, query: AlertQuery) -> List[AlertRead]:
         """
         Query alerts with filters.
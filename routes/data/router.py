@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from models.filters import FilterParams
 from .schemas import AlertCreate, AlertRead, AlertUpdate
 from .service import DataService, get_service
+from ..services import ServiceWorker, get_service_worker
 
 data_router = APIRouter(prefix="/data", tags=["data"])
 
@@ -70,13 +71,14 @@ async def get_chart_data(filters: FilterParams, service: DataService = Depends(g
 async def create_data_with_secret_key(
     secret_key: str,
     payload: AlertCreate,
-    service: DataService = Depends(get_service)
+    services: ServiceWorker = Depends(get_service_worker)
 ) -> AlertRead:
     """
     Create a new alert using a secret key for authentication.
 
     This endpoint is designed for TradingView webhooks or other external integrations.
     The secret key automatically associates the alert with the correct strategy.
+    The key is checked through KeysService before the alert is processed.
 
     Args:
         secret_key: The secret key for strategy authentication
@@ -85,4 +87,4 @@ async def create_data_with_secret_key(
     Returns:
         The created alert with strategy information populated
     """
-    return await service.create_with_secret_key(secret_key, payload)
+    return await services.create_alert(payload, secret_key)
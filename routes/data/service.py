@@ -1,20 +1,30 @@
 import json
+import time
 from typing import List, Optional
 import logging
 
 from fastapi import HTTPException
 from starlette import status
 
-from core.constants import k
 from core.logic import filtered_data_chart, db_data_to_df
 from models.filters import FilterParams
-from models.secret_key import SecretKeyIndex
 from .schemas import AlertCreate, AlertRead, AlertUpdate, AlertQuery
 from .repository import DataRepository
 from .helpers import alert_processing_pipeline
 
 logger = logging.getLogger(__name__)
 
+# Strategy names change rarely, so serve them from memory for a short while
+STRATEGY_NAMES_TTL = 30.0  # seconds
+_strategy_names_cache: dict = {}
+
+
+def _invalidate_strategy_names(name: Optional[str]) -> None:
+    """Drop the cached strategy names if `name` is not among them."""
+    cached_names = _strategy_names_cache.get('names')
+    if cached_names is not None and name and name not in cached_names:
+        _strategy_names_cache.clear()
+
 
 class DataService:
     """
@@ -53,55 +63,31 @@ class DataService:
         """
         try:
             payload = await alert_processing_pipeline(payload)
-            return await self.repo.create(payload)
+            created = await self.repo.create(payload)
+            _invalidate_strategy_names(created.name)
+            return created
         except Exception as e:
-            logger.error(f"Error creating alert: {e}")
+            logger.error("Error creating alert: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to create alert: {str(e)}"
             )
 
-    async def create_with_secret_key(self, secret_key: str, payload: AlertCreate) -> AlertRead:
-        """
-        Create an alert with secret key authentication.
-
-        This method looks up the strategy name associated with the secret key
-        and automatically populates the alert with this information.
-
-        Args:
-            secret_key: The secret key for authentication
-            payload: Alert creation data
-
-        Returns:
-            The created alert
-
-        Raises:
-            HTTPException: If the secret key is invalid
-        """
-        # Look up the strategy name from the secret key
-        key_doc = await SecretKeyIndex.find_one(SecretKeyIndex.secret_key == secret_key)
-
-        if not key_doc:
-            logger.warning(f"Invalid secret key attempted: {secret_key[:10]}...")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid secret key provided"
-            )
-
-        # Populate the alert with strategy information
-        payload.name = key_doc.name
-        payload.secret_key = secret_key
-
-        logger.info(f"Creating alert for strategy: {key_doc.name}")
-        return await self.create(payload)
-
     async def update(self, item_id: str, payload: AlertUpdate) -> Optional[AlertRead]:
         """Update an existing alert."""
-        return await self.repo.update(item_id, payload)
+        updated = await self.repo.update(item_id, payload)
+        if updated and payload.name is not None:
+            # A rename can retire a strategy name as well as add one
+            _strategy_names_cache.clear()
+        return updated
 
     async def delete(self, item_id: str) -> bool:
         """Delete an alert by ID."""
-        return await self.repo.delete(item_id)
+        deleted = await self.repo.delete(item_id)
+        if deleted:
+            # The alert may have been the last one for its strategy
+            _strategy_names_cache.clear()
+        return deleted
 
     async def query(self, query: AlertQuery) -> List[AlertRead]:
         """Query alerts with filters."""
@@ -137,7 +123,7 @@ class DataService:
 
             return chart_json
         except Exception as e:
-            logger.error(f"Error generating chart: {e}")
+            logger.error("Error generating chart: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to generate chart: {str(e)}"
@@ -147,20 +133,26 @@ class DataService:
         """
         Get all unique strategy names from alerts.
 
+        Results are cached for STRATEGY_NAMES_TTL seconds and dropped early
+        when an alert with a new strategy name is created, an alert is renamed,
+        or an alert is deleted.
+
         Returns:
             List of unique strategy names
         """
-        try:
-            data = await self.repo.list()
-            if not data:
-                return []
+        if _strategy_names_cache.get('expires', 0.0) > time.monotonic():
+            return list(_strategy_names_cache['names'])
 
-            df = await db_data_to_df(data)
-            return df[k.NAME].dropna().unique().tolist()
+        try:
+            names = await self.repo.get_strategy_names()
         except Exception as e:
-            logger.error(f"Error getting strategy names: {e}")
+            logger.error("Error getting strategy names: %s", e)
             return []
 
+        _strategy_names_cache['names'] = names
+        _strategy_names_cache['expires'] = time.monotonic() + STRATEGY_NAMES_TTL
+        return list(names)
+
 
 async def get_service() -> DataService:
     """Dependency injection for DataService."""
@@ -1,4 +1,8 @@
+import hashlib
+import math
 import secrets
+from typing import Iterable, Iterator
+
 
 def generate_secret_key(length: int = 32) -> str:
     """
@@ -6,3 +10,54 @@ def generate_secret_key(length: int = 32) -> str:
     Default length is 32 bytes (~43 characters).
     """
     return secrets.token_urlsafe(length)
+
+
+class SecretKeyFilter:
+    """
+    In-memory bloom filter of known secret keys.
+
+    Lets lookups reject unknown keys without a database round-trip. A hit may
+    be a false positive, so callers still confirm against the database. Keys
+    are never removed (deleted keys just become false positives), and until
+    `rebuild` has run every key is reported as possibly present.
+
+    The filter only learns about keys written by its own process, so it is
+    only correct when one process handles every key write (a single uvicorn
+    worker, one instance, no direct writes to Mongo). Anywhere else a valid
+    key created elsewhere would be rejected until restart, which is why the
+    app only loads it when KEY_FILTER_ENABLED is set.
+    """
+    def __init__(self, capacity: int = 10_000, error_rate: float = 0.001):
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.ready = False
+
+    def _positions(self, secret_key: str) -> Iterator[int]:
+        # Double hashing: derive all probe positions from one digest
+        digest = hashlib.blake2b(secret_key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, secret_key: str) -> None:
+        """Record a secret key as valid."""
+        for pos in self._positions(secret_key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def rebuild(self, secret_keys: Iterable[str]) -> None:
+        """Reset the filter to exactly the given keys and mark it ready."""
+        self._bits = bytearray(len(self._bits))
+        for secret_key in secret_keys:
+            self.add(secret_key)
+        self.ready = True
+
+    def __contains__(self, secret_key: str) -> bool:
+        if not self.ready:
+            return True
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(secret_key))
+
+
+# Process-wide filter shared by every KeysService; populated in the app lifespan
+# when KEY_FILTER_ENABLED is set, otherwise it stays unbuilt and passes every key
+key_filter = SecretKeyFilter()
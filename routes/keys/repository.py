@@ -1,5 +1,7 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from .schemas import KeysCreate, KeysRead, KeysUpdate
 from models.secret_key import SecretKeyIndex
 
@@ -56,6 +58,37 @@ class KeysRepository:
         await doc.insert()
         return KeysRead(id=str(doc.id), **doc.model_dump(by_alias=True, exclude={'id'}))
 
+    async def upsert_key(self, payload: KeysCreate) -> Tuple[KeysRead, bool]:
+        """
+        Insert a key for a strategy name unless one already exists.
+
+        Uses find_one_and_update with $setOnInsert, so the existence check and
+        the insert share one round-trip. The unique index on `name` keeps
+        concurrent binds from inserting two keys: the losing upsert raises
+        DuplicateKeyError and is reported as already existing.
+
+        Args:
+            payload: The key creation data
+
+        Returns:
+            The stored key and True if it was inserted, False if it already existed
+        """
+        collection = SecretKeyIndex.get_motor_collection()
+        try:
+            doc = await collection.find_one_and_update(
+                {"name": payload.name},
+                {"$setOnInsert": payload.model_dump()},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # A concurrent bind won the insert; hand back its key
+            doc = await collection.find_one({"name": payload.name})
+            if doc is None:
+                raise
+        created = doc["secret_key"] == payload.secret_key
+        return KeysRead(id=str(doc.pop("_id")), **doc), created
+
     async def update(self, item_id: str, payload: KeysUpdate) -> Optional[KeysRead]:
         """
         Update an existing secret key entry.
@@ -116,6 +149,15 @@ class KeysRepository:
             return KeysRead(id=str(doc.id), **doc.model_dump(by_alias=True, exclude={'id'}))
         return None
 
+    async def list_secret_keys(self) -> List[str]:
+        """
+        Retrieve every stored secret key without hydrating documents.
+
+        Returns:
+            List of secret key strings
+        """
+        return await SecretKeyIndex.distinct("secret_key")
+
     async def search_by_name(self, name: str) -> List[KeysRead]:
         """
         Search for keys by strategy name (optimized query).
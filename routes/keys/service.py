@@ -1,9 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import logging
 
 from .schemas import KeysCreate, KeysRead, KeysUpdate
 from .repository import KeysRepository
-from .helpers import generate_secret_key
+from .helpers import generate_secret_key, key_filter, SecretKeyFilter
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +15,9 @@ class KeysService:
     This service handles operations related to secret keys including
     CRUD operations and key-to-strategy-name lookups.
     """
-    def __init__(self, repo: KeysRepository):
+    def __init__(self, repo: KeysRepository, key_filter: Optional[SecretKeyFilter] = None):
         self.repo = repo
+        self.key_filter = key_filter
 
     async def list(self) -> List[KeysRead]:
         """List all secret keys."""
@@ -39,9 +40,32 @@ class KeysService:
         # If no secret_key provided, generate one
         if not payload.secret_key:
             payload.secret_key = generate_secret_key()
-            logger.info(f"Generated new secret key for strategy: {payload.name}")
+            logger.info("Generated new secret key for strategy: %s", payload.name)
 
-        return await self.repo.create(payload)
+        created = await self.repo.create(payload)
+        if self.key_filter is not None:
+            self.key_filter.add(created.secret_key)
+        return created
+
+    async def upsert_key(self, payload: KeysCreate) -> Tuple[KeysRead, bool]:
+        """
+        Create a secret key entry unless the strategy name already has one.
+
+        Args:
+            payload: Key creation data
+
+        Returns:
+            The stored key entry and whether it was newly created
+        """
+        if not payload.secret_key:
+            payload.secret_key = generate_secret_key()
+
+        key, created = await self.repo.upsert_key(payload)
+        if created:
+            logger.info("Generated new secret key for strategy: %s", payload.name)
+            if self.key_filter is not None:
+                self.key_filter.add(key.secret_key)
+        return key, created
 
     async def update(self, item_id: str, payload: KeysUpdate) -> Optional[KeysRead]:
         """Update an existing secret key entry."""
@@ -56,6 +80,7 @@ class KeysService:
         Look up a strategy name by its secret key.
 
         This is an optimized query using an indexed field for fast lookups.
+        Keys rejected by the bloom filter never reach the database.
 
         Args:
             secret_key: The secret key to search for
@@ -63,15 +88,27 @@ class KeysService:
         Returns:
             The strategy name if found, None otherwise
         """
+        if self.key_filter is not None and secret_key not in self.key_filter:
+            logger.warning("Secret key rejected by key filter")
+            return None
+
         key_entry = await self.repo.get_by_secret_key(secret_key)
         if key_entry:
-            logger.debug(f"Found strategy name for key: {key_entry.name}")
+            logger.debug("Found strategy name for key: %s", key_entry.name)
             return key_entry.name
-        logger.warning(f"No strategy found for provided secret key")
+        logger.warning("No strategy found for provided secret key")
         return None
 
 
 async def get_service() -> KeysService:
     """Dependency injection for KeysService."""
     repo = KeysRepository()
-    return KeysService(repo)
+    return KeysService(repo, key_filter=key_filter)
+
+
+async def load_key_filter() -> SecretKeyFilter:
+    """Rebuild the shared secret key filter from the keys collection."""
+    secret_keys = await KeysRepository().list_secret_keys()
+    key_filter.rebuild(secret_keys)
+    logger.info("Loaded %d secret keys into key filter", len(secret_keys))
+    return key_filter
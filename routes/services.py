@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Union, List
+from typing import List
 from fastapi import HTTPException, status
 
 from .data.schemas import AlertRead, AlertCreate
@@ -49,7 +49,7 @@ class ServiceWorker(BaseModel):
         payload.secret_key = secret_key
         return await self.data_service.create(payload)
 
-    async def bind_key_to_name(self, name: str) -> Union[KeysRead, dict]:
+    async def bind_key_to_name(self, name: str) -> KeysRead:
         """
         Bind a new secret key to a strategy name.
 
@@ -57,24 +57,24 @@ class ServiceWorker(BaseModel):
             name: The strategy name to bind
 
         Returns:
-            The created key or a message if the name is already bound
-        """
-        # Check if name already has a key
-        existing_keys = await self.keys_service.repo.search_by_name(name)
-        if existing_keys:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Strategy name '{name}' is already bound to a secret key."
-            )
+            The created key
 
-        # Generate new secret key
-        secret_key = generate_secret_key()
+        Raises:
+            HTTPException: If the name is already bound to a key
+        """
+        # Insert the key only if the name is unbound, in one round-trip
         payload = KeysCreate(
-            secret_key=secret_key,
+            secret_key=generate_secret_key(),
             name=name,
             description="Auto-generated key"
         )
-        return await self.keys_service.create(payload)
+        key, created = await self.keys_service.upsert_key(payload)
+        if not created:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Strategy name '{name}' is already bound to a secret key."
+            )
+        return key
 
     async def get_strategy_names(self) -> List[str]:
         """Get all unique strategy names from alerts."""
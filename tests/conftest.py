@@ -5,21 +5,38 @@ This module provides common fixtures used across multiple test files,
 including mock services, test data, and database setup.
 """
 import pytest
+from pytest_asyncio import is_async_test
 from unittest.mock import AsyncMock, MagicMock
 from typing import List
 from datetime import datetime, timezone
 import os
 
+import pandas as pd
+
 # Set test environment variables
 os.environ.setdefault('MONGO_DB_CONNECTION_STRING', 'mongodb://localhost:27017')
 os.environ.setdefault('MONGO_DB_NAME', 'arrow_test')
 os.environ.setdefault('ENVIRONMENT', 'testing')
 os.environ.setdefault('ALLOWED_ORIGINS', 'http://localhost:3000')
 
+CSV_PATH = os.path.join(os.path.dirname(__file__), '..', 'tv_alerts.csv')
+
+# Copy-on-Write: shallow copies of the session frames only allocate the
+# columns a test actually writes to
+pd.set_option("mode.copy_on_write", True)
+
 from routes.data.schemas import AlertCreate, AlertRead, AlertUpdate
 from routes.keys.schemas import KeysCreate, KeysRead
 
 
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture
 def sample_alert_create() -> AlertCreate:
     """Sample AlertCreate payload for testing."""
@@ -70,6 +87,62 @@ def sample_alert_list() -> List[AlertRead]:
     ]
 
 
+@pytest.fixture(scope="session")
+def alert_payload() -> AlertCreate:
+    """Minimal AlertCreate payload shared across the session.
+
+    Treat as read-only; use `alert_payload.model_copy()` before passing it to
+    code that mutates the payload (e.g. DataService.create).
+    """
+    return AlertCreate(contract="NQ1!", trade_type="buy", quantity=1, price=100.0)
+
+
+@pytest.fixture(scope="session")
+def alert_payload_dict(alert_payload: AlertCreate) -> dict:
+    """`alert_payload.model_dump()`, computed once per session. Read-only."""
+    return alert_payload.model_dump()
+
+
+@pytest.fixture(scope="session")
+def alert_read(alert_payload_dict: dict) -> AlertRead:
+    """AlertRead matching `alert_payload`, shared across the session."""
+    return AlertRead(id="507f1f77bcf86cd799439011", **alert_payload_dict)
+
+
+@pytest.fixture(scope="session")
+def raw_df():
+    """tv_alerts.csv parsed once per session. Read-only; take `.copy()` to mutate."""
+    from core.logic.alert_data import utils
+    return utils.load_data_from_csv(CSV_PATH)
+
+
+@pytest.fixture
+def df(raw_df):
+    """Shallow per-test copy of `raw_df`; copy-on-write keeps edits local."""
+    return raw_df.copy(deep=False)
+
+
+@pytest.fixture(scope="session")
+def json_df(raw_df):
+    """`raw_df` with Description JSON extracted, computed once per session."""
+    from core.logic.alert_data import processing
+    return processing.extract_json_from_description(raw_df.copy())
+
+
+@pytest.fixture(scope="session")
+def indexed_df(json_df):
+    """`json_df` indexed by its parsed timestamp column."""
+    from core.logic.alert_data import processing
+    return processing.format_timestamp_column_and_set_as_index(json_df.copy(), col_name='timestamp')
+
+
+@pytest.fixture(scope="session")
+def cleaned_df(raw_df):
+    """`raw_df` run through the full clean_filterable_json_df_pipe."""
+    from core.logic.alert_data import processing
+    return processing.clean_filterable_json_df_pipe(raw_df.copy())
+
+
 @pytest.fixture
 def sample_alert_update() -> AlertUpdate:
     """Sample AlertUpdate payload for testing."""
@@ -88,6 +161,49 @@ def mock_keys_repository():
     return AsyncMock()
 
 
+class FakeRepo:
+    """
+    Lightweight async repository stub.
+
+    Implements the DataRepository/KeysRepository methods the service tests
+    call; each returns `returns[<method name>]` (None if unset). Cheaper than
+    AsyncMock when a test doesn't assert on calls, and any other attribute
+    raises AttributeError as usual.
+    """
+    def __init__(self, **returns):
+        self.returns = returns
+
+    async def list(self, limit=None):
+        return self.returns.get('list')
+
+    async def get(self, item_id):
+        return self.returns.get('get')
+
+    async def create(self, payload):
+        return self.returns.get('create')
+
+    async def update(self, item_id, payload):
+        return self.returns.get('update')
+
+    async def delete(self, item_id):
+        return self.returns.get('delete')
+
+    async def query(self, query):
+        return self.returns.get('query')
+
+    async def get_by_secret_key(self, secret_key):
+        return self.returns.get('get_by_secret_key')
+
+    async def upsert_key(self, payload):
+        return self.returns.get('upsert_key')
+
+
+@pytest.fixture
+def fake_repo() -> FakeRepo:
+    """FakeRepo for service tests that only need canned return values."""
+    return FakeRepo()
+
+
 @pytest.fixture
 def sample_secret_key() -> str:
     """Sample secret key for testing."""
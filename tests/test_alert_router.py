@@ -93,8 +93,6 @@ def test_create_alert_with_secret_key(client):
 
 def test_create_alert_with_invalid_key(client):
     """Test creating an alert with an invalid secret key."""
-    from fastapi import HTTPException
-    
     # Create mock services
     keys_service = create_autospec(KeysService, instance=True)
     data_service = create_autospec(DataService, instance=True)
@@ -124,18 +122,15 @@ def test_bind_key_to_name_success(client):
     """Test binding a new secret key to a strategy name."""
     # Create mock services
     keys_service = create_autospec(KeysService, instance=True)
-    keys_service.repo = AsyncMock()
     data_service = create_autospec(DataService, instance=True)
     
-    keys_service.repo.search_by_name = AsyncMock(return_value=[])
-    
     expected_key = KeysRead(
         id="507f1f77bcf86cd799439011",
         secret_key="new_generated_key_abc123",
         name="My New Strategy"
     )
     
-    keys_service.create = AsyncMock(return_value=expected_key)
+    keys_service.upsert_key = AsyncMock(return_value=(expected_key, True))
     
     mock_worker = ServiceWorker(keys_service=keys_service, data_service=data_service)
     
@@ -156,11 +151,8 @@ def test_bind_key_to_name_success(client):
 
 def test_bind_key_to_existing_name_conflict(client):
     """Test binding a key to a name that already has one."""
-    from fastapi import HTTPException
-    
     # Create mock services
     keys_service = create_autospec(KeysService, instance=True)
-    keys_service.repo = AsyncMock()
     data_service = create_autospec(DataService, instance=True)
     
     existing_key = KeysRead(
@@ -168,7 +160,7 @@ def test_bind_key_to_existing_name_conflict(client):
         secret_key="existing_key",
         name="Existing Strategy"
     )
-    keys_service.repo.search_by_name = AsyncMock(return_value=[existing_key])
+    keys_service.upsert_key = AsyncMock(return_value=(existing_key, False))
     
     mock_worker = ServiceWorker(keys_service=keys_service, data_service=data_service)
     
@@ -1,51 +1,73 @@
 import pytest
-import asyncio
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 from routes.data.repository import DataRepository
-from routes.data.schemas import AlertCreate, AlertUpdate
+from routes.data.schemas import AlertUpdate
 from models.alerts import BaseAlert
 
+ALERT_ID = "507f1f77bcf86cd799439011"
+
+class _Cursor:
+    """Minimal stand-in for a Beanie FindMany cursor."""
+    def __init__(self, items):
+        self._items = items
+
+    async def to_list(self):
+        return self._items
+
+@pytest.fixture(scope="module")
+def repo():
+    return DataRepository()
+
+async def _assign_id(doc):
+    doc.id = ALERT_ID
+
+@pytest.fixture
+def patched_alert(monkeypatch):
+    # BaseAlert(...) needs a collection even though Beanie is never initialized
+    monkeypatch.setattr(BaseAlert, "get_motor_collection", MagicMock(return_value=MagicMock()))
+    mocks = SimpleNamespace(insert=AsyncMock(side_effect=_assign_id), get=AsyncMock(), save=AsyncMock(), delete=AsyncMock())
+    for name in ("get", "save", "delete"):
+        monkeypatch.setattr(BaseAlert, name, getattr(mocks, name))
+    # insert is bound so the stub can set the id on the inserted document
+    monkeypatch.setattr(BaseAlert, "insert", lambda self: mocks.insert(self))
+    return mocks
+
 @pytest.mark.asyncio
-async def test_create_and_get():
-    repo = DataRepository()
-    payload = AlertCreate(contract="NQ1!", trade_type="buy", quantity=1, price=100.0)
-    with patch.object(BaseAlert, "insert", new_callable=AsyncMock) as mock_insert, \
-         patch.object(BaseAlert, "get", new_callable=AsyncMock) as mock_get:
-        doc = BaseAlert(**payload.model_dump())
-        doc.id = "507f1f77bcf86cd799439011"
-        mock_insert.return_value = None
-        mock_get.return_value = doc
-        created = await repo.create(payload)
-        assert created.id == "507f1f77bcf86cd799439011"
-        fetched = await repo.get("507f1f77bcf86cd799439011")
-        assert fetched.id == "507f1f77bcf86cd799439011"
+async def test_create_and_get(repo, patched_alert, alert_payload, alert_payload_dict):
+    doc = BaseAlert(**alert_payload_dict)
+    doc.id = ALERT_ID
+    patched_alert.get.return_value = doc
+    created = await repo.create(alert_payload)
+    assert created.id == ALERT_ID
+    patched_alert.insert.assert_awaited_once()
+    fetched = await repo.get(ALERT_ID)
+    assert fetched.id == ALERT_ID
 
 @pytest.mark.asyncio
-async def test_update_and_delete():
-    repo = DataRepository()
-    payload = AlertCreate(contract="NQ1!", trade_type="buy", quantity=1, price=100.0)
+async def test_update_and_delete(repo, patched_alert, alert_payload_dict):
     update = AlertUpdate(quantity=5)
-    with patch.object(BaseAlert, "get", new_callable=AsyncMock) as mock_get, \
-         patch.object(BaseAlert, "save", new_callable=AsyncMock) as mock_save, \
-         patch.object(BaseAlert, "delete", new_callable=AsyncMock) as mock_delete:
-        doc = BaseAlert(**payload.model_dump())
-        doc.id = "507f1f77bcf86cd799439011"
-        mock_get.return_value = doc
-        mock_save.return_value = None
-        mock_delete.return_value = None
-        updated = await repo.update("507f1f77bcf86cd799439011", update)
-        assert updated.quantity == 5
-        deleted = await repo.delete("507f1f77bcf86cd799439011")
-        assert deleted is True
+    doc = BaseAlert(**alert_payload_dict)
+    doc.id = ALERT_ID
+    patched_alert.get.return_value = doc
+    updated = await repo.update(ALERT_ID, update)
+    assert updated.quantity == 5
+    deleted = await repo.delete(ALERT_ID)
+    assert deleted is True
 
 @pytest.mark.asyncio
-async def test_list():
-    repo = DataRepository()
-    with patch.object(BaseAlert, "find_all", new_callable=AsyncMock) as mock_find_all:
-        doc = BaseAlert(contract="NQ1!", trade_type="buy", quantity=1, price=100.0)
-        doc.id = "507f1f77bcf86cd799439011"
-        mock_find_all.return_value.to_list = AsyncMock(return_value=[doc])
+async def test_list(repo, patched_alert):
+    doc = BaseAlert(contract="NQ1!", trade_type="buy", quantity=1, price=100.0)
+    doc.id = ALERT_ID
+    with patch.object(BaseAlert, "find_all", return_value=_Cursor([doc])):
         items = await repo.list()
         assert len(items) == 1
-        assert items[0].id == "507f1f77bcf86cd799439011"
+        assert items[0].id == ALERT_ID
 
+
+@pytest.mark.asyncio
+async def test_get_strategy_names(repo, monkeypatch):
+    distinct = AsyncMock(return_value=["stratA", "stratB"])
+    monkeypatch.setattr(BaseAlert, "distinct", distinct)
+    assert await repo.get_strategy_names() == ["stratA", "stratB"]
+    distinct.assert_awaited_once_with("name", {"name": {"$ne": None}})
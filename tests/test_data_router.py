@@ -1,79 +1,111 @@
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
 from routes.data.router import data_router
+from routes.data.service import get_service
+from routes.services import get_service_worker
 from routes.data.schemas import AlertCreate, AlertRead, AlertUpdate
 
-@pytest.fixture
+CHART_FILTERS_PAYLOAD = {"name": "stratA", "start_time": "9:03", "end_time": "16:00", "days": ["mon", "tue"], "weeks": [1, 2]}
+
+@pytest.fixture(scope="module")
 def app():
     app = FastAPI()
     app.include_router(data_router)
     return app
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
-    return TestClient(app)
+    with TestClient(app) as c:
+        yield c
 
-@pytest.mark.asyncio
-async def test_list_data(client, monkeypatch):
+@pytest.fixture
+def mock_service(app):
     mock_service = AsyncMock()
+    app.dependency_overrides[get_service] = lambda: mock_service
+    yield mock_service
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def mock_worker(app):
+    mock_worker = MagicMock()
+    mock_worker.create_alert = AsyncMock()
+    app.dependency_overrides[get_service_worker] = lambda: mock_worker
+    yield mock_worker
+    app.dependency_overrides.clear()
+
+def test_list_data(client, mock_service):
     mock_service.list.return_value = [AlertRead(id="507f1f77bcf86cd799439011", contract="NQ1!", trade_type="buy", quantity=1, price=100.0, secret_key=None, timestamp=None)]
-    monkeypatch.setattr("routes.data.router.get_service", lambda: mock_service)
     response = client.get("/data/")
     assert response.status_code == 200
     assert response.json()[0]["id"] == "507f1f77bcf86cd799439011"
 
-@pytest.mark.asyncio
-async def test_get_data_found(client, monkeypatch):
-    mock_service = AsyncMock()
+def test_get_data_found(client, mock_service):
     mock_service.get.return_value = AlertRead(id="507f1f77bcf86cd799439011", contract="NQ1!", trade_type="buy", quantity=1, price=100.0, secret_key=None, timestamp=None)
-    monkeypatch.setattr("routes.data.router.get_service", lambda: mock_service)
     response = client.get("/data/507f1f77bcf86cd799439011")
     assert response.status_code == 200
     assert response.json()["id"] == "507f1f77bcf86cd799439011"
 
-@pytest.mark.asyncio
-async def test_get_data_not_found(client, monkeypatch):
-    mock_service = AsyncMock()
+def test_get_data_not_found(client, mock_service):
     mock_service.get.return_value = None
-    monkeypatch.setattr("routes.data.router.get_service", lambda: mock_service)
     response = client.get("/data/badid")
     assert response.status_code == 404
 
-@pytest.mark.asyncio
-async def test_create_data(client, monkeypatch):
-    mock_service = AsyncMock()
+def test_create_data(client, mock_service):
     payload = {"contract": "NQ1!", "trade_type": "buy", "quantity": 1, "price": 100.0}
     mock_service.create.return_value = AlertRead(id="507f1f77bcf86cd799439011", **payload)
-    monkeypatch.setattr("routes.data.router.get_service", lambda: mock_service)
     response = client.post("/data/", json=payload)
     assert response.status_code == 201
     assert response.json()["id"] == "507f1f77bcf86cd799439011"
 
-@pytest.mark.asyncio
-async def test_update_data(client, monkeypatch):
-    mock_service = AsyncMock()
+def test_update_data(client, mock_service):
     payload = {"quantity": 2}
     mock_service.update.return_value = AlertRead(id="507f1f77bcf86cd799439011", contract="NQ1!", trade_type="buy", quantity=2, price=100.0, secret_key=None, timestamp=None)
-    monkeypatch.setattr("routes.data.router.get_service", lambda: mock_service)
     response = client.put("/data/507f1f77bcf86cd799439011", json=payload)
     assert response.status_code == 200
     assert response.json()["quantity"] == 2
 
-@pytest.mark.asyncio
-async def test_delete_data(client, monkeypatch):
-    mock_service = AsyncMock()
+def test_delete_data(client, mock_service):
     mock_service.delete.return_value = True
-    monkeypatch.setattr("routes.data.router.get_service", lambda: mock_service)
     response = client.delete("/data/507f1f77bcf86cd799439011")
     assert response.status_code == 204
 
-@pytest.mark.asyncio
-async def test_delete_data_not_found(client, monkeypatch):
-    mock_service = AsyncMock()
+def test_delete_data_not_found(client, mock_service):
     mock_service.delete.return_value = False
-    monkeypatch.setattr("routes.data.router.get_service", lambda: mock_service)
     response = client.delete("/data/badid")
     assert response.status_code == 404
 
+def test_chart_filters(client, mock_service):
+    mock_service.generate_chart.return_value = {"data": []}
+    response = client.post("/data/chart/filters", json=CHART_FILTERS_PAYLOAD)
+    assert response.status_code == 200
+    assert response.json() == {"chart_json": {"data": []}}
+    filters = mock_service.generate_chart.call_args.args[0]
+    assert filters.start_time == "09:03"
+
+@pytest.mark.parametrize("overrides", [
+    {"start_time": "25:00"},
+    {"end_time": None},
+    {"weeks": [6]},
+], ids=["invalid_hour", "missing_end_time", "invalid_week"])
+def test_chart_filters_invalid(client, mock_service, overrides):
+    response = client.post("/data/chart/filters", json={**CHART_FILTERS_PAYLOAD, **overrides})
+    assert response.status_code == 422
+    mock_service.generate_chart.assert_not_called()
+
+def test_create_data_with_secret_key(client, mock_worker):
+    payload = {"contract": "NQ1!", "trade_type": "buy", "quantity": 1, "price": 100.0}
+    mock_worker.create_alert.return_value = AlertRead(id="507f1f77bcf86cd799439011", name="stratA", secret_key="key123", **payload)
+    response = client.post("/data/key123", json=payload)
+    assert response.status_code == 201
+    assert response.json()["name"] == "stratA"
+    sent_payload, secret_key = mock_worker.create_alert.call_args.args
+    assert secret_key == "key123"
+    assert sent_payload.contract == "NQ1!"
+
+def test_create_data_with_invalid_secret_key(client, mock_worker):
+    mock_worker.create_alert.side_effect = HTTPException(status_code=401, detail="Invalid secret key provided.")
+    response = client.post("/data/badkey", json={"contract": "NQ1!", "trade_type": "buy", "quantity": 1, "price": 100.0})
+    assert response.status_code == 401
@@ -3,6 +3,8 @@ from pydantic import ValidationError
 from routes.data.schemas import AlertCreate, AlertUpdate, AlertRead
 import datetime as dt
 
+_BASE_ALERT_KWARGS = {"contract": "NQ1!", "trade_type": "buy", "quantity": 1, "price": 100.0}
+
 def test_datacreate_valid():
     obj = AlertCreate(
         contract="NQ1!",
@@ -19,11 +21,14 @@ def test_datacreate_valid():
 
 @pytest.mark.parametrize("field,value", [
     ("quantity", 0),
+    ("quantity", -1),
     ("price", 0.0),
+    ("price", -100.0),
+    ("trade_type", "hold"),
+    ("contract", None),
 ])
 def test_datacreate_invalid(field, value):
-    kwargs = dict(contract="NQ1!", trade_type="buy", quantity=1, price=100.0)
-    kwargs[field] = value
+    kwargs = {**_BASE_ALERT_KWARGS, field: value}
     with pytest.raises(ValidationError):
         AlertCreate(**kwargs)
 
@@ -1,39 +1,73 @@
 import pytest
 from unittest.mock import AsyncMock
+from routes.data import service as service_module
 from routes.data.service import DataService
 from routes.data.schemas import AlertCreate, AlertUpdate, AlertRead
 
+ITEM_ID = "507f1f77bcf86cd799439011"
+
+@pytest.fixture(autouse=True)
+def strategy_names_cache(monkeypatch):
+    # Fresh module cache per test so a failing assertion can't leak names
+    cache = {}
+    monkeypatch.setattr(service_module, "_strategy_names_cache", cache)
+    return cache
+
+@pytest.fixture
+def wired_service(fake_repo, alert_read):
+    fake_repo.returns.update(
+        create=alert_read,
+        get=alert_read,
+        list=[alert_read],
+        update=alert_read,
+        delete=True,
+    )
+    return DataService(fake_repo)
+
 @pytest.mark.asyncio
-async def test_service_crud():
-    repo = AsyncMock()
-    service = DataService(repo)
-    payload = AlertCreate(contract="NQ1!", trade_type="buy", quantity=1, price=100.0)
-    data_read = AlertRead(id="507f1f77bcf86cd799439011", **payload.model_dump())
-    repo.create.return_value = data_read
-    repo.get.return_value = data_read
-    repo.list.return_value = [data_read]
-    repo.update.return_value = data_read
-    repo.delete.return_value = True
-
-    created = await service.create(payload)
-    assert created.id == "507f1f77bcf86cd799439011"
-    fetched = await service.get("507f1f77bcf86cd799439011")
-    assert fetched.id == "507f1f77bcf86cd799439011"
-    items = await service.list()
-    assert len(items) == 1
-    updated = await service.update("507f1f77bcf86cd799439011", AlertUpdate(quantity=2))
-    assert updated.id == "507f1f77bcf86cd799439011"
-    deleted = await service.delete("507f1f77bcf86cd799439011")
-    assert deleted is True
+@pytest.mark.parametrize("op,make_args,check", [
+    ("create", lambda payload: (payload.model_copy(),), lambda result: result.id == ITEM_ID),
+    ("get", lambda payload: (ITEM_ID,), lambda result: result.id == ITEM_ID),
+    ("list", lambda payload: (), lambda result: len(result) == 1),
+    ("update", lambda payload: (ITEM_ID, AlertUpdate(quantity=2)), lambda result: result.id == ITEM_ID),
+    ("delete", lambda payload: (ITEM_ID,), lambda result: result is True),
+], ids=["create", "get", "list", "update", "delete"])
+async def test_service_crud(wired_service, alert_payload, op, make_args, check):
+    result = await getattr(wired_service, op)(*make_args(alert_payload))
+    assert check(result)
 
 @pytest.mark.asyncio
-async def test_service_not_found():
-    repo = AsyncMock()
-    service = DataService(repo)
-    repo.get.return_value = None
-    repo.update.return_value = None
-    repo.delete.return_value = False
+async def test_service_not_found(fake_repo):
+    service = DataService(fake_repo)
+    fake_repo.returns['delete'] = False
     assert await service.get("badid") is None
     assert await service.update("badid", AlertUpdate(quantity=2)) is None
     assert await service.delete("badid") is False
 
+@pytest.mark.asyncio
+async def test_service_get_strategy_names_cached():
+    repo = AsyncMock()
+    service = DataService(repo)
+    repo.get_strategy_names.return_value = ["stratA", "stratB"]
+
+    assert await service.get_strategy_names() == ["stratA", "stratB"]
+    assert await service.get_strategy_names() == ["stratA", "stratB"]
+    repo.get_strategy_names.assert_awaited_once()
+
+    # A new strategy name invalidates the cache
+    repo.create.return_value = AlertRead(id="507f1f77bcf86cd799439011", contract="NQ1!", trade_type="buy", quantity=1, price=100.0, name="stratC")
+    await service.create(AlertCreate(contract="NQ1!", trade_type="buy", quantity=1, price=100.0, name="stratC"))
+    repo.get_strategy_names.return_value = ["stratA", "stratB", "stratC"]
+    assert await service.get_strategy_names() == ["stratA", "stratB", "stratC"]
+    assert repo.get_strategy_names.await_count == 2
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("op,args,invalidated", [
+    ("update", (ITEM_ID, AlertUpdate(name="stratB")), True),
+    ("update", (ITEM_ID, AlertUpdate(quantity=2)), False),
+    ("delete", (ITEM_ID,), True),
+], ids=["rename", "update-other-field", "delete"])
+async def test_service_write_invalidates_strategy_names(wired_service, strategy_names_cache, op, args, invalidated):
+    strategy_names_cache.update(names=["stratA"], expires=float("inf"))
+    await getattr(wired_service, op)(*args)
+    assert (strategy_names_cache == {}) is invalidated
@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from routes.keys.repository import KeysRepository
+from routes.keys.schemas import KeysCreate
+from models.secret_key import SecretKeyIndex
+
+KEY_ID = ObjectId("507f1f77bcf86cd799439011")
+
+@pytest.fixture(scope="module")
+def repo():
+    return KeysRepository()
+
+@pytest.fixture
+def payload():
+    return KeysCreate(secret_key="new_key", name="stratA", description="Auto-generated key")
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = MagicMock(find_one_and_update=AsyncMock(), find_one=AsyncMock())
+    monkeypatch.setattr(SecretKeyIndex, "get_motor_collection", MagicMock(return_value=collection))
+    return collection
+
+def _stored(secret_key):
+    return {"_id": KEY_ID, "secret_key": secret_key, "name": "stratA", "description": "Auto-generated key"}
+
+@pytest.mark.asyncio
+async def test_upsert_key_inserted(repo, payload, collection):
+    collection.find_one_and_update.return_value = _stored("new_key")
+    key, created = await repo.upsert_key(payload)
+    assert created is True
+    assert key.id == str(KEY_ID)
+    assert key.secret_key == "new_key" and key.name == "stratA"
+    collection.find_one_and_update.assert_awaited_once_with(
+        {"name": "stratA"},
+        {"$setOnInsert": payload.model_dump()},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+@pytest.mark.asyncio
+async def test_upsert_key_existing(repo, payload, collection):
+    collection.find_one_and_update.return_value = _stored("existing_key")
+    key, created = await repo.upsert_key(payload)
+    assert created is False
+    assert key.id == str(KEY_ID)
+    assert key.secret_key == "existing_key"
+
+@pytest.mark.asyncio
+async def test_upsert_key_lost_race(repo, payload, collection):
+    collection.find_one_and_update.side_effect = DuplicateKeyError("E11000 duplicate key error")
+    collection.find_one.return_value = _stored("winner_key")
+    key, created = await repo.upsert_key(payload)
+    assert created is False
+    assert key.secret_key == "winner_key"
+    collection.find_one.assert_awaited_once_with({"name": "stratA"})
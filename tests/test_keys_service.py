@@ -2,6 +2,7 @@
 import pytest
 from unittest.mock import AsyncMock, patch
 from routes.keys.service import KeysService
+from routes.keys.helpers import SecretKeyFilter, generate_secret_key
 from routes.keys.schemas import KeysCreate, KeysRead, KeysUpdate
 
 
@@ -28,10 +29,9 @@ async def test_keys_service_create_generates_key_if_not_provided():
 
 
 @pytest.mark.asyncio
-async def test_keys_service_create_uses_provided_key():
+async def test_keys_service_create_uses_provided_key(fake_repo):
     """Test that service uses provided secret key."""
-    repo = AsyncMock()
-    service = KeysService(repo)
+    service = KeysService(fake_repo)
     
     provided_key = "my_custom_secret_key"
     payload = KeysCreate(name="Test Strategy", secret_key=provided_key)
@@ -40,7 +40,7 @@ async def test_keys_service_create_uses_provided_key():
         secret_key=provided_key,
         name="Test Strategy"
     )
-    repo.create.return_value = expected_read
+    fake_repo.returns['create'] = expected_read
     
     result = await service.create(payload)
     
@@ -69,12 +69,9 @@ async def test_keys_service_get_name_by_key_found():
 
 
 @pytest.mark.asyncio
-async def test_keys_service_get_name_by_key_not_found():
+async def test_keys_service_get_name_by_key_not_found(fake_repo):
     """Test lookup with invalid secret key returns None."""
-    repo = AsyncMock()
-    service = KeysService(repo)
-    
-    repo.get_by_secret_key.return_value = None
+    service = KeysService(fake_repo)
     
     result = await service.get_name_by_key("invalid_key")
     
@@ -82,16 +79,15 @@ async def test_keys_service_get_name_by_key_not_found():
 
 
 @pytest.mark.asyncio
-async def test_keys_service_list():
+async def test_keys_service_list(fake_repo):
     """Test listing all keys."""
-    repo = AsyncMock()
-    service = KeysService(repo)
+    service = KeysService(fake_repo)
     
     expected_keys = [
         KeysRead(id="507f1f77bcf86cd799439011", secret_key="key1", name="Strategy 1"),
         KeysRead(id="507f1f77bcf86cd799439012", secret_key="key2", name="Strategy 2"),
     ]
-    repo.list.return_value = expected_keys
+    fake_repo.returns['list'] = expected_keys
     
     result = await service.list()
     
@@ -145,3 +141,94 @@ async def test_keys_service_delete():
     
     assert result is True
     repo.delete.assert_called_once_with(item_id)
+
+
+@pytest.mark.asyncio
+async def test_keys_service_get_name_by_key_rejected_by_filter():
+    """Test that keys missing from the filter never reach the repository."""
+    repo = AsyncMock()
+    key_filter = SecretKeyFilter()
+    key_filter.rebuild(["known_key"])
+    service = KeysService(repo, key_filter=key_filter)
+    
+    result = await service.get_name_by_key("unknown_key")
+    
+    assert result is None
+    repo.get_by_secret_key.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_keys_service_create_adds_key_to_filter(fake_repo):
+    """Test that created keys pass the filter without a rebuild."""
+    key_filter = SecretKeyFilter()
+    key_filter.rebuild([])
+    service = KeysService(fake_repo, key_filter=key_filter)
+    
+    created = KeysRead(
+        id="507f1f77bcf86cd799439011",
+        secret_key="new_key",
+        name="Test Strategy"
+    )
+    fake_repo.returns.update(create=created, get_by_secret_key=created)
+    
+    await service.create(KeysCreate(name="Test Strategy", secret_key="new_key"))
+    
+    assert "new_key" in key_filter
+    assert await service.get_name_by_key("new_key") == "Test Strategy"
+
+
+def test_secret_key_filter_passes_everything_until_built():
+    """Test that an unbuilt filter cannot reject keys."""
+    key_filter = SecretKeyFilter()
+    
+    assert "any_key" in key_filter
+    
+    key_filter.rebuild(["key1", "key2"])
+    
+    assert "key1" in key_filter
+    assert "key2" in key_filter
+    assert "any_key" not in key_filter
+
+
+@pytest.mark.asyncio
+async def test_keys_service_upsert_key_created():
+    """Test that a newly inserted key is reported as created and filtered."""
+    repo = AsyncMock()
+    key_filter = SecretKeyFilter()
+    key_filter.rebuild([])
+    service = KeysService(repo, key_filter=key_filter)
+    
+    payload = KeysCreate(name="Test Strategy", secret_key=None)
+    repo.upsert_key.side_effect = lambda p: (
+        KeysRead(id="507f1f77bcf86cd799439011", secret_key=p.secret_key, name=p.name),
+        True,
+    )
+    
+    key, created = await service.upsert_key(payload)
+    
+    assert created is True
+    assert key.secret_key == payload.secret_key
+    assert payload.secret_key in key_filter
+
+
+@pytest.mark.asyncio
+async def test_keys_service_upsert_key_existing(fake_repo):
+    """Test that an existing key is returned untouched."""
+    service = KeysService(fake_repo)
+    
+    existing = KeysRead(id="507f1f77bcf86cd799439011", secret_key="existing_key", name="Test Strategy")
+    fake_repo.returns['upsert_key'] = (existing, False)
+    
+    key, created = await service.upsert_key(KeysCreate(name="Test Strategy", secret_key="new_key"))
+    
+    assert created is False
+    assert key == existing
+
+
+def test_generate_secret_key_is_urlsafe_and_unique():
+    """Test that generated keys are URL-safe, 43 characters and never repeat."""
+    keys = [generate_secret_key() for _ in range(100)]
+    
+    assert len(set(keys)) == len(keys)
+    assert all(len(key) == 43 for key in keys)
+    assert all(set(key) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_") for key in keys)
@@ -1,44 +1,47 @@
 """Tests for main.py - FastAPI application entry point"""
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from fastapi.testclient import TestClient
-from fastapi import status
+
+
+@pytest.fixture(scope="module")
+def app():
+    # Patch init_db so the lifespan context manager never touches a real DB
+    with patch('main.init_db', new_callable=AsyncMock):
+        from main import app
+        yield app
+
+
+@pytest.fixture(scope="module")
+def client(app):
+    return TestClient(app, raise_server_exceptions=False)
 
 
 @pytest.mark.asyncio
 async def test_root_endpoint():
     """Test root endpoint returns app information."""
-    # Import main and create test client
-    # We need to patch the lifespan context manager to avoid DB initialization
-    with patch('main.init_db', new_callable=AsyncMock):
-        from main import app
-        client = TestClient(app, raise_server_exceptions=False)
-        
-        response = client.get("/")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "version" in data
-        assert "environment" in data
-        assert data["version"] == "1.0.0"
+    from main import root
+    
+    data = await root()
+    
+    assert "message" in data
+    assert "version" in data
+    assert "environment" in data
+    assert data["version"] == "1.0.0"
 
 
 @pytest.mark.asyncio
 async def test_health_endpoint_healthy():
     """Test health endpoint when database is connected."""
-    with patch('main.init_db', new_callable=AsyncMock), \
-         patch('models.alerts.BaseAlert.find_one', new_callable=AsyncMock) as mock_find:
-        
+    from main import health
+    
+    with patch('models.alerts.BaseAlert.find_one', new_callable=AsyncMock) as mock_find:
         mock_find.return_value = None  # DB query succeeds
         
-        from main import app
-        client = TestClient(app, raise_server_exceptions=False)
+        data = await health()
         
-        response = client.get("/health")
-        
-        assert response.status_code == 200
-        data = response.json()
         assert data["status"] == "healthy"
         assert data["database"] == "connected"
 
@@ -46,33 +49,25 @@ async def test_health_endpoint_healthy():
 @pytest.mark.asyncio
 async def test_health_endpoint_unhealthy():
     """Test health endpoint when database is disconnected."""
-    with patch('main.init_db', new_callable=AsyncMock), \
-         patch('models.alerts.BaseAlert.find_one', new_callable=AsyncMock) as mock_find:
-        
+    from main import health
+    
+    with patch('models.alerts.BaseAlert.find_one', new_callable=AsyncMock) as mock_find:
         # Simulate database error
         mock_find.side_effect = Exception("Database connection failed")
         
-        from main import app
-        client = TestClient(app, raise_server_exceptions=False)
-        
-        response = client.get("/health")
+        response = await health()
         
         assert response.status_code == 503
-        data = response.json()
+        data = json.loads(response.body)
         assert data["status"] == "unhealthy"
         assert data["database"] == "disconnected"
         assert "error" in data
 
 
 @pytest.mark.asyncio
-async def test_cors_headers_in_development():
+async def test_cors_headers_in_development(client):
     """Test that CORS headers are permissive in development."""
-    with patch('main.init_db', new_callable=AsyncMock), \
-         patch('main.ENVIRONMENT', 'development'):
-        
-        from main import app
-        client = TestClient(app, raise_server_exceptions=False)
-        
+    with patch('main.ENVIRONMENT', 'development'):
         # Make a request with Origin header
         response = client.get("/", headers={"Origin": "http://localhost:3000"})
         
@@ -81,22 +76,42 @@ async def test_cors_headers_in_development():
 
 
 @pytest.mark.asyncio
-async def test_app_includes_routers():
+async def test_app_includes_routers(app):
     """Test that all routers are included in the app."""
-    with patch('main.init_db', new_callable=AsyncMock):
-        from main import app
-        
-        # Check that routes from different routers exist
-        routes = [route.path for route in app.routes]
-        
-        # Root and health endpoints
-        assert "/" in routes or any("/docs" in r for r in routes)
-        
-        # Data router endpoints (prefix /data)
-        assert any("/data" in r for r in routes)
-        
-        # Alert router endpoints (prefix /alerts)
-        assert any("/alerts" in r for r in routes)
-        
-        # Keys router endpoints (prefix /keys)
-        assert any("/keys" in r for r in routes)
+    # Collect which router prefixes appear in a single pass over the routes
+    prefixes = ("/data", "/alerts", "/keys", "/docs")
+    found = set()
+    has_root = False
+    for route in app.routes:
+        has_root = has_root or route.path == "/"
+        found.update(p for p in prefixes if p in route.path)
+    
+    # Root and health endpoints
+    assert has_root or "/docs" in found
+    
+    # Data, alert and keys router endpoints
+    assert {"/data", "/alerts", "/keys"} <= found
+
+
+@pytest.mark.asyncio
+async def test_app_uses_orjson_responses(app):
+    """Test that endpoints serialize through ORJSONResponse by default."""
+    from fastapi.responses import ORJSONResponse
+    
+    assert app.router.default_response_class is ORJSONResponse
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enabled", [False, True], ids=["disabled", "enabled"])
+async def test_lifespan_loads_key_filter_only_when_enabled(enabled):
+    """Test that the secret key filter is opt-in for single-process deployments."""
+    from fastapi import FastAPI
+    from main import lifespan
+    
+    with patch('main.init_db', new_callable=AsyncMock, return_value=MagicMock()), \
+         patch('main.load_key_filter', new_callable=AsyncMock) as mock_load, \
+         patch('main.KEY_FILTER_ENABLED', enabled):
+        async with lifespan(FastAPI()):
+            pass
+    
+    assert mock_load.await_count == int(enabled)
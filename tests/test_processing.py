@@ -1,16 +1,7 @@
+import numpy as np
 import pandas as pd
-import pytest
-
-import importlib.util
-import pathlib
-
-# Load the processing module directly by file path to avoid importing logic.__init__ during pytest collection
-_proc_path = pathlib.Path(__file__).resolve().parents[1] / 'core' / 'logic' / 'alert_data' / 'processing.py'
-_spec = importlib.util.spec_from_file_location("processing_mod", str(_proc_path))
-_processing = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_processing)  # type: ignore[arg-type]
-proc = _processing
 
+from core.logic.alert_data import processing as proc
 from core.constants import DESCRIPTION, NAME, TIME, TIMESTAMP, TRADE_TYPE, PRICE, QUANTITY, PROFIT, rPROFIT
 
 
@@ -66,8 +57,8 @@ def test_trim_to_closed_trades_basic_selection():
 
     # trimmed should start at index 2 and end at index 4 (inclusive)
     assert len(trimmed) == 3
-    assert trimmed['trade_type'].iloc[0].lower() == 'buy'
-    assert trimmed['trade_type'].iloc[-1].lower() == 'exit'
+    assert trimmed['trade_type'].array[0].lower() == 'buy'
+    assert trimmed['trade_type'].array[-1].lower() == 'exit'
 
 
 def test_apply_flips_preserves_casing_and_trims():
@@ -81,13 +72,13 @@ def test_apply_flips_preserves_casing_and_trims():
     flipped = proc.apply_flips(df, signal_col=TRADE_TYPE)
 
     # ' Buy ' -> 'Sell' (trimmed and title-cased), 'SELL' -> 'buy' (upper->upper preserved)
-    assert flipped[TRADE_TYPE].iloc[0] == 'Sell'
+    assert flipped[TRADE_TYPE].array[0] == 'Sell'
     # Original 'SELL' is all upper, _match_case should return upper for new word
-    assert flipped[TRADE_TYPE].iloc[1] == 'BUY'
+    assert flipped[TRADE_TYPE].array[1] == 'BUY'
     # Exits remain unchanged (but trimmed)
-    assert flipped[TRADE_TYPE].iloc[2] == 'exit'
+    assert flipped[TRADE_TYPE].array[2] == 'exit'
     # Unknown values are returned trimmed
-    assert flipped[TRADE_TYPE].iloc[3] == 'Hold'
+    assert flipped[TRADE_TYPE].array[3] == 'Hold'
 
 
 def test_add_trade_profit_basic_with_qty_and_fees():
@@ -113,12 +104,20 @@ def test_add_trade_profit_basic_with_qty_and_fees():
 
     # Check profit on first exit: (110-100)*2*1 - (1 + 2*0.5) = 20 - (1+1) = 18
     expected_first = (110.0 - 100.0) * 1 * (2.0 * 1.0) - (1.0 + 2.0 * 0.5)
-    assert out[PROFIT].iloc[1] == pytest.approx(expected_first)
 
     # Check profit on second exit: (195-200)*-1*1 - (1 + 1*0.5) = (-5)*-1 -1.5 = 5 -1.5 = 3.5
     expected_second = (195.0 - 200.0) * (-1) * (1.0 * 1.0) - (1.0 + 1.0 * 0.5)
-    assert out[PROFIT].iloc[3] == pytest.approx(expected_second)
 
-    # Check running profit is cumulative
-    assert out[rPROFIT].iloc[1] == pytest.approx(expected_first)
-    assert out[rPROFIT].iloc[3] == pytest.approx(expected_first + expected_second)
+    # Profit lands only on exit rows; entry rows stay NaN
+    np.testing.assert_allclose(
+        out[PROFIT].to_numpy(),
+        np.array([np.nan, expected_first, np.nan, expected_second]),
+        equal_nan=True,
+    )
+
+    # Check running profit is cumulative (cumsum keeps NaN on non-exit rows)
+    np.testing.assert_allclose(
+        out[rPROFIT].to_numpy(),
+        np.array([np.nan, expected_first, np.nan, expected_first + expected_second]),
+        equal_nan=True,
+    )
@@ -1,30 +1,45 @@
 """Tests for routes/services.py - ServiceWorker orchestration layer"""
 import pytest
-from unittest.mock import AsyncMock, MagicMock, create_autospec
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
-from routes.services import ServiceWorker
-from routes.data.schemas import AlertCreate, AlertRead
+from routes.services import ServiceWorker, get_service_worker
+from routes.data.schemas import AlertRead
 from routes.data.service import DataService
 from routes.keys.schemas import KeysCreate, KeysRead
 from routes.keys.service import KeysService
 
 
+# spec= keeps ServiceWorker's isinstance validation happy without autospec's
+# per-method signature introspection
+def _mk_keys():
+    return MagicMock(spec=KeysService)
+
+
+def _mk_data():
+    return MagicMock(spec=DataService)
+
+
+def _async_return(value):
+    """Plain coroutine stub returning `value`; `.calls` records (args, kwargs)."""
+    async def _f(*args, **kwargs):
+        _f.calls.append((args, kwargs))
+        return value
+    _f.calls = []
+    return _f
+
+
 @pytest.mark.asyncio
-async def test_service_worker_create_alert_success():
+async def test_service_worker_create_alert_success(alert_payload):
     """Test successful alert creation with valid secret key."""
-    # Create mock services using create_autospec to pass type validation
-    keys_service = create_autospec(KeysService, instance=True)
-    data_service = create_autospec(DataService, instance=True)
+    # Create mock services
+    keys_service = _mk_keys()
+    data_service = _mk_data()
     
     # Configure async methods
-    keys_service.get_name_by_key = AsyncMock(return_value="Test Strategy")
+    keys_service.get_name_by_key = _async_return("Test Strategy")
     
-    payload = AlertCreate(
-        contract="NQ1!",
-        trade_type="buy",
-        quantity=1,
-        price=100.0
-    )
+    # create_alert writes name/secret_key onto the payload
+    payload = alert_payload.model_copy()
     
     expected_alert = AlertRead(
         id="507f1f77bcf86cd799439011",
@@ -35,7 +50,7 @@ async def test_service_worker_create_alert_success():
         name="Test Strategy",
         secret_key="test_key_123"
     )
-    data_service.create = AsyncMock(return_value=expected_alert)
+    data_service.create = _async_return(expected_alert)
     
     # Create service worker
     worker = ServiceWorker(
@@ -49,26 +64,22 @@ async def test_service_worker_create_alert_success():
     # Verify
     assert result.name == "Test Strategy"
     assert result.secret_key == "test_key_123"
-    keys_service.get_name_by_key.assert_called_once_with("test_key_123")
-    data_service.create.assert_called_once()
+    assert keys_service.get_name_by_key.calls == [(("test_key_123",), {})]
+    assert len(data_service.create.calls) == 1
 
 
 @pytest.mark.asyncio
-async def test_service_worker_create_alert_invalid_key():
+async def test_service_worker_create_alert_invalid_key(alert_payload):
     """Test alert creation with invalid secret key raises HTTPException."""
     # Create mock services
-    keys_service = create_autospec(KeysService, instance=True)
-    data_service = create_autospec(DataService, instance=True)
+    keys_service = _mk_keys()
+    data_service = _mk_data()
     
-    keys_service.get_name_by_key = AsyncMock(return_value=None)
+    keys_service.get_name_by_key = _async_return(None)
     data_service.create = AsyncMock()
     
-    payload = AlertCreate(
-        contract="NQ1!",
-        trade_type="buy",
-        quantity=1,
-        price=100.0
-    )
+    # create_alert writes name/secret_key onto the payload
+    payload = alert_payload.model_copy()
     
     # Create service worker
     worker = ServiceWorker(
@@ -89,19 +100,16 @@ async def test_service_worker_create_alert_invalid_key():
 async def test_service_worker_bind_key_to_name_success():
     """Test successful binding of new secret key to strategy name."""
     # Create mock services
-    keys_service = create_autospec(KeysService, instance=True)
-    keys_service.repo = AsyncMock()
-    data_service = create_autospec(DataService, instance=True)
-    
-    # No existing keys for this name
-    keys_service.repo.search_by_name = AsyncMock(return_value=[])
+    keys_service = _mk_keys()
+    data_service = _mk_data()
     
+    # No existing key for this name, so the upsert inserts
     expected_key = KeysRead(
         id="507f1f77bcf86cd799439011",
         secret_key="generated_key_abc123",
         name="New Strategy"
     )
-    keys_service.create = AsyncMock(return_value=expected_key)
+    keys_service.upsert_key = _async_return((expected_key, True))
     
     # Create service worker
     worker = ServiceWorker(
@@ -115,26 +123,25 @@ async def test_service_worker_bind_key_to_name_success():
     # Verify
     assert result.name == "New Strategy"
     assert result.secret_key is not None
-    keys_service.repo.search_by_name.assert_called_once_with("New Strategy")
-    keys_service.create.assert_called_once()
+    assert len(keys_service.upsert_key.calls) == 1
+    args, _ = keys_service.upsert_key.calls[0]
+    assert args[0].name == "New Strategy"
 
 
 @pytest.mark.asyncio
 async def test_service_worker_bind_key_to_name_already_exists():
     """Test binding key to name that already has a key raises HTTPException."""
     # Create mock services
-    keys_service = create_autospec(KeysService, instance=True)
-    keys_service.repo = AsyncMock()
-    data_service = create_autospec(DataService, instance=True)
+    keys_service = _mk_keys()
+    data_service = _mk_data()
     
-    # Existing key found
+    # Existing key found, so the upsert leaves it untouched
     existing_key = KeysRead(
         id="507f1f77bcf86cd799439011",
         secret_key="existing_key",
         name="Existing Strategy"
     )
-    keys_service.repo.search_by_name = AsyncMock(return_value=[existing_key])
-    keys_service.create = AsyncMock()
+    keys_service.upsert_key = _async_return((existing_key, False))
     
     # Create service worker
     worker = ServiceWorker(
@@ -148,18 +155,18 @@ async def test_service_worker_bind_key_to_name_already_exists():
     
     assert exc_info.value.status_code == 409
     assert "already bound" in exc_info.value.detail
-    keys_service.create.assert_not_called()
+    assert len(keys_service.upsert_key.calls) == 1
 
 
 @pytest.mark.asyncio
 async def test_service_worker_get_strategy_names():
     """Test getting all strategy names."""
     # Create mock services
-    keys_service = create_autospec(KeysService, instance=True)
-    data_service = create_autospec(DataService, instance=True)
+    keys_service = _mk_keys()
+    data_service = _mk_data()
     
     expected_names = ["Strategy 1", "Strategy 2", "Strategy 3"]
-    data_service.get_strategy_names = AsyncMock(return_value=expected_names)
+    data_service.get_strategy_names = _async_return(expected_names)
     
     # Create service worker
     worker = ServiceWorker(
@@ -173,4 +180,19 @@ async def test_service_worker_get_strategy_names():
     # Verify
     assert result == expected_names
     assert len(result) == 3
-    data_service.get_strategy_names.assert_called_once()
+    assert len(data_service.get_strategy_names.calls) == 1
+
+
+def test_service_worker_fields_have_no_eager_defaults():
+    """Test that services are only built by get_service_worker, never at import."""
+    for field in ServiceWorker.model_fields.values():
+        assert field.is_required()
+
+
+@pytest.mark.asyncio
+async def test_get_service_worker_builds_both_services():
+    """Test that the dependency wires a keys and a data service."""
+    worker = await get_service_worker()
+    
+    assert isinstance(worker.keys_service, KeysService)
+    assert isinstance(worker.data_service, DataService)
@@ -0,0 +1,51 @@
+"""
+One-off migration for the unique index on SecretKeyIndex.name.
+
+Databases created before `name` became unique carry a plain `name_1` index,
+and init_beanie cannot replace an index whose options changed, so the app
+fails at startup until that index is dropped. Duplicate names must be
+resolved first or Mongo will refuse to build the unique index.
+
+Usage:
+    python tools/migrate_unique_key_names.py            # report only
+    python tools/migrate_unique_key_names.py --apply    # keep oldest key per name, drop name_1
+"""
+import sys
+
+from decouple import config
+from pymongo import MongoClient
+
+COLLECTION = "secret_key_index"
+INDEX_NAME = "name_1"
+
+
+def main(apply: bool) -> None:
+    client = MongoClient(config('MONGO_DB_CONNECTION_STRING'))
+    collection = client[config('MONGO_DB_NAME')][COLLECTION]
+
+    duplicates = list(collection.aggregate([
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": "$name", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ]))
+    for dup in duplicates:
+        print(f"Duplicate name {dup['_id']!r}: {dup['count']} keys, keeping {dup['ids'][0]}")
+
+    index = collection.index_information().get(INDEX_NAME)
+    needs_drop = index is not None and not index.get("unique", False)
+    print(f"Index {INDEX_NAME}: {'non-unique, will be dropped' if needs_drop else 'ok'}")
+
+    if not apply:
+        print("Dry run; re-run with --apply to make changes.")
+        return
+
+    for dup in duplicates:
+        result = collection.delete_many({"_id": {"$in": dup["ids"][1:]}})
+        print(f"Removed {result.deleted_count} newer keys for {dup['_id']!r}")
+    if needs_drop:
+        collection.drop_index(INDEX_NAME)
+        print(f"Dropped {INDEX_NAME}; the unique index is created on next app startup.")
+
+
+if __name__ == '__main__':
+    main(apply="--apply" in sys.argv[1:])